@@ -23,14 +23,26 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from .painter import Painter
+from .layouttracker import LayoutTracker
 from .timeline import Timeline
 from .task import Task
 
 
-@dataclass
-class Group:
+@dataclass(slots=True)
+class Group(LayoutTracker):
     """Roadmap Group class"""
 
+    _layout_fields = frozenset(
+        {
+            "text",
+            "font",
+            "font_size",
+            "font_colour",
+            "fill_colour",
+            "text_alignment",
+        }
+    )
+
     text: str = field(init=True, default=None)
     font: str = field(init=True, default=None)
     font_size: int = field(init=True, default=None)
@@ -46,6 +58,9 @@ class Group:
     text_x: int = field(init=False, default=0)
     text_y: int = field(init=False, default=0)
     painter: Painter = None
+    _layout_dirty: bool = field(init=False, default=True, repr=False, compare=False)
+    _layout_origin: tuple = field(init=False, default=None, repr=False, compare=False)
+    _layout_tasks: tuple = field(init=False, default=(), repr=False, compare=False)
 
     # def __post_init__(self):
     #     """This method is called after __init__() is called"""
@@ -104,6 +119,34 @@ class Group:
 
         return task
 
+    def is_layout_dirty(self) -> bool:
+        """Check whether this group or any of its tasks changed since the last layout
+
+        Returns:
+            bool: True if the group needs to be laid out again
+        """
+        return (
+            self._layout_dirty
+            or self._children_changed(self._layout_tasks, self.tasks)
+            or any(task.is_layout_dirty() for task in self.tasks)
+        )
+
+    def ensure_layout(self, painter: Painter, timeline: Timeline) -> None:
+        """Set group draw position, re-using the previous layout when nothing has changed
+
+        Args:
+            painter (Painter): Pillow wrapper class instance
+            timeline (Timeline): Timeline instance
+        """
+        if (
+            self.is_layout_dirty() is False
+            and self._layout_origin == (painter.next_y_pos, timeline)
+        ):
+            painter.next_y_pos = self.box_y + self.box_height
+            return
+
+        self.set_draw_position(painter, timeline)
+
     def set_draw_position(self, painter: Painter, timeline: Timeline) -> None:
         """Set group draw position
 
@@ -111,6 +154,7 @@ class Group:
             painter (Painter): Pillow wrapper class instance
             timeline (Timeline): Timeline instance
         """
+        self._layout_origin = (painter.next_y_pos, timeline)
 
         # Calculate number of milestones in group
         milestone_count = 0
@@ -161,30 +205,45 @@ class Group:
             task.set_draw_position(painter, self.box_x, painter.next_y_pos, timeline)
 
         painter.next_y_pos = self.box_y + self.box_height
+        self._layout_dirty = False
+        self._layout_tasks = tuple(self.tasks)
 
-    def draw(self, painter: Painter) -> None:
-        """Draw group
+    def emit_ops(self, ops: list) -> None:
+        """Append the drawing operations of this group and its tasks
 
         Args:
-            painter (Painter): Pillow wrapper class instance
+            ops (list): Drawing operations to be drawn by Painter.draw_batch()
         """
         # Step 1: draw group
-        painter.draw_box_with_text(
-            self.box_x,
-            self.box_y,
-            self.box_width,
-            self.box_height,
-            self.fill_colour,
-            self.text,
-            self.text_alignment,
-            self.font,
-            self.font_size,
-            self.font_colour,
+        ops.append(
+            (
+                "box_with_text",
+                self.box_x,
+                self.box_y,
+                self.box_width,
+                self.box_height,
+                self.fill_colour,
+                self.text,
+                self.text_alignment,
+                self.font,
+                self.font_size,
+                self.font_colour,
+            )
         )
 
         # Step 2: draw tasks
-        for tasks in self.tasks:
-            tasks.draw(painter)
+        for task in self.tasks:
+            task.emit_ops(ops)
+
+    def draw(self, painter: Painter) -> None:
+        """Draw group
+
+        Args:
+            painter (Painter): Pillow wrapper class instance
+        """
+        ops = []
+        self.emit_ops(ops)
+        painter.draw_batch(ops)
 
     def __enter__(self):
         """This method is called when the 'with' statement is used"""
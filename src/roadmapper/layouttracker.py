@@ -0,0 +1,55 @@
+# MIT License
+
+# Copyright (c) 2022 CS Goh
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+class LayoutTracker:
+    """Mixin for roadmap items that are laid out once and re-used across draw() calls
+
+    Assigning any field listed in the class's _layout_fields marks the item's layout as
+    dirty. Subclasses must define a _layout_dirty field.
+    """
+
+    __slots__ = ()
+
+    _layout_fields: frozenset = frozenset()
+
+    def __setattr__(self, name, value) -> None:
+        """Mark the layout as dirty when a layout field is assigned"""
+        object.__setattr__(self, name, value)
+        if name in self._layout_fields:
+            object.__setattr__(self, "_layout_dirty", True)
+
+    @staticmethod
+    def _children_changed(snapshot: tuple, children: list) -> bool:
+        """Check whether a list of child items changed since a snapshot of it was taken
+
+        Args:
+            snapshot (tuple): Child items at the time of the last layout
+            children (list): Current child items
+
+        Returns:
+            bool: True if items were added, removed, replaced or reordered
+        """
+        return len(snapshot) != len(children) or any(
+            previous is not current for previous, current in zip(snapshot, children)
+        )
@@ -20,10 +20,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from dataclasses import dataclass, field
 from .painter import Painter
 from .timeline import Timeline
+from .timelinemode import TimelineMode
 
 
 @dataclass(kw_only=True)
@@ -59,16 +61,30 @@ class Marker:
         current_date = current_date.replace(hour=0, minute=0, second=0, microsecond=0)
         label_pos_percentage = 0
         correct_timeline = False
-        for timeline_item in timeline.timeline_items:
-            if timeline_item.start <= current_date <= timeline_item.end:
+        timeline_items = timeline.timeline_items
+        timeline_item = timeline_items[-1]
+        first_index, last_index = 0, len(timeline_items)
+        ### Outside of weekly mode, timeline items are in chronological order, so only
+        ### the items between the first one ending on/after today and the last one
+        ### starting on/before today can enclose the current date. Weekly item dates
+        ### are derived from wrapped week numbers and can go back in time at a year
+        ### boundary, so all of them are checked.
+        if timeline.mode != TimelineMode.WEEKLY:
+            first_index = bisect_left(
+                timeline_items, current_date, key=lambda item: item.end
+            )
+            last_index = bisect_right(
+                timeline_items, current_date, key=lambda item: item.start
+            )
+        for candidate in timeline_items[first_index:last_index]:
+            if candidate.start <= current_date <= candidate.end:
                 # calc label position
                 (
                     correct_timeline,
                     label_pos_percentage,
-                ) = timeline_item.get_timeline_pos_percentage(
-                    timeline.mode, current_date
-                )
+                ) = candidate.get_timeline_pos_percentage(timeline.mode, current_date)
                 if correct_timeline is True:
+                    timeline_item = candidate
                     break
 
         self.not_in_timeline_range = not correct_timeline
@@ -22,13 +22,26 @@
 
 from datetime import datetime
 from dataclasses import dataclass, field
+from .layouttracker import LayoutTracker
 from .painter import Painter
 
 
-@dataclass(kw_only=True)
-class Milestone:
+@dataclass(kw_only=True, slots=True)
+class Milestone(LayoutTracker):
     """Roadmap Milestone class"""
 
+    _layout_fields = frozenset(
+        {
+            "text",
+            "date",
+            "font",
+            "font_size",
+            "font_colour",
+            "fill_colour",
+            "text_alignment",
+        }
+    )
+
     text: str = field(init=True, default=None)
     date: datetime = field(init=True, default=None)
     font: str = field(init=True, default=None)
@@ -43,28 +56,52 @@ class Milestone:
     diamond_height: int = field(init=False, default=0)
     text_x: int = field(init=False, default=0)
     text_y: int = field(init=False, default=0)
+    _layout_dirty: bool = field(init=False, default=True, repr=False, compare=False)
 
+    def is_layout_dirty(self) -> bool:
+        """Check whether this milestone changed since the last layout
 
-    def draw(self, painter: Painter) -> None:
-        """Draw milestone
+        Returns:
+            bool: True if the milestone needs to be laid out again
+        """
+        return self._layout_dirty
+
+    def emit_ops(self, ops: list) -> None:
+        """Append the milestone drawing operations
 
         Args:
-            painter (Painter): Pillow wrapper class instance
+            ops (list): Drawing operations to be drawn by Painter.draw_batch()
         """
         if (self.diamond_x != 0) and (self.diamond_y != 0):
-            painter.draw_diamond(
-                self.diamond_x,
-                self.diamond_y,
-                self.diamond_width,
-                self.diamond_height,
-                self.fill_colour,
+            ops.append(
+                (
+                    "diamond",
+                    self.diamond_x,
+                    self.diamond_y,
+                    self.diamond_width,
+                    self.diamond_height,
+                    self.fill_colour,
+                )
             )
         if (self.text_x != 0) and (self.text_y != 0):
-            painter.draw_text(
-                self.text_x,
-                self.text_y,
-                self.text,
-                self.font,
-                self.font_size,
-                self.font_colour,
+            ops.append(
+                (
+                    "text",
+                    self.text_x,
+                    self.text_y,
+                    self.text,
+                    self.font,
+                    self.font_size,
+                    self.font_colour,
+                )
             )
+
+    def draw(self, painter: Painter) -> None:
+        """Draw milestone
+
+        Args:
+            painter (Painter): Pillow wrapper class instance
+        """
+        ops = []
+        self.emit_ops(ops)
+        painter.draw_batch(ops)
@@ -23,6 +23,7 @@
 
 import os
 import sys
+from functools import lru_cache
 from .colourtheme import ColourTheme
 from PIL import Image, ImageDraw, ImageFont, ImageColor
 import drawsvg as dw
@@ -34,6 +35,84 @@ class UnsupportedOSException(Exception):
     pass
 
 
+def _get_font_path(font_name: str) -> str:
+    """Get the path to the font file"""
+    if font_name.endswith(".ttf") or font_name.endswith(".otf"):
+        return font_name
+    if sys.platform.startswith("win"):  # Windows
+        return os.path.join("C:\\", "Windows", "Fonts", f"{font_name}.ttf")
+    elif sys.platform.startswith("darwin"):  # macOS
+        return os.path.join(
+            "/", "System", "Library", "Fonts", "Supplemental", f"{font_name}.ttf"
+        )
+    elif sys.platform.startswith("linux"):  # Linux
+        font_dir = "/usr/share/fonts/truetype/msttcorefonts"
+
+        if os.path.exists(os.path.join(font_dir, f"{font_name}.ttf")):
+            return os.path.join(font_dir, f"{font_name}.ttf")
+        ### This is cater for cases where msttcorefonts is not installed
+        linux_font_name = "DejaVuSans"  # Default font for Linux
+        return os.path.join(
+            "/",
+            "usr",
+            "share",
+            "fonts",
+            "truetype",
+            "dejavu",  # Use the DejaVu font directory instead of msttcorefonts
+            f"{linux_font_name}.ttf",
+        )
+    else:
+        raise UnsupportedOSException("Unsupported operating system")
+
+
+@lru_cache(maxsize=128)
+def _resolve_font(font_name: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """Load a font. Fonts are cached as a roadmap only uses a handful of font and size combinations.
+
+    Args:
+        font_name (str): Font name or font file path
+        font_size (int): Font size
+
+    Returns:
+        ImageFont.FreeTypeFont: Pillow font instance
+    """
+    return ImageFont.truetype(_get_font_path(font_name), font_size)
+
+
+### ImageColor.getrgb() is only cached by Pillow itself from 10.2.0 onwards,
+### while Pillow>=10.0.0 is supported
+@lru_cache(maxsize=256)
+def _resolve_colour(colour: str) -> tuple:
+    """Convert a colour to its RGB values
+
+    Args:
+        colour (str): HTML colour name or hex code. Eg. #FFFFFF or LightGreen
+
+    Returns:
+        tuple(int, int, int): Red, green and blue values
+    """
+    return ImageColor.getrgb(colour)
+
+
+@lru_cache(maxsize=4096)
+def _get_text_dimension(text: str, font_name: str, font_size: int) -> tuple:
+    """Get text dimension. Results are cached as the same labels are measured many times.
+
+    Args:
+        text (str): Text that is used to calculate dimension
+        font_name (str): Font name or font file path
+        font_size (int): Font size
+
+    Returns:
+        (text_width (int), text_height (int)): Text dimension (width, height)
+    """
+    left, _, right, bottom = _resolve_font(font_name, font_size).getbbox(text)
+    font_width = right
+    font_height = bottom
+
+    return font_width, font_height
+
+
 class Painter:
     width = 0
     height = 0
@@ -55,6 +134,13 @@ class Painter:
 
     timeline_height = 20
 
+    ### draw_batch() operation types and the draw_* methods that draw them
+    batch_draw_methods = {
+        "box_with_text": "draw_box_with_text",
+        "diamond": "draw_diamond",
+        "text": "draw_text",
+    }
+
     # Colour scheme
     title_font: str
     title_font_size: int
@@ -178,32 +264,7 @@ class Painter:
 
     def get_font_path(self, font_name: str) -> str:
         """Get the path to the font file"""
-        if font_name.endswith(".ttf") or font_name.endswith(".otf"):
-            return font_name
-        if sys.platform.startswith("win"):  # Windows
-            return os.path.join("C:\\", "Windows", "Fonts", f"{font_name}.ttf")
-        elif sys.platform.startswith("darwin"):  # macOS
-            return os.path.join(
-                "/", "System", "Library", "Fonts", "Supplemental", f"{font_name}.ttf"
-            )
-        elif sys.platform.startswith("linux"):  # Linux
-            font_dir = "/usr/share/fonts/truetype/msttcorefonts"
-
-            if os.path.exists(os.path.join(font_dir, f"{font_name}.ttf")):
-                return os.path.join(font_dir, f"{font_name}.ttf")
-            ### This is cater for cases where msttcorefonts is not installed
-            linux_font_name = "DejaVuSans"  # Default font for Linux
-            return os.path.join(
-                "/",
-                "usr",
-                "share",
-                "fonts",
-                "truetype",
-                "dejavu",  # Use the DejaVu font directory instead of msttcorefonts
-                f"{linux_font_name}.ttf",
-            )
-        else:
-            raise UnsupportedOSException("Unsupported operating system")
+        return _get_font_path(font_name)
 
     def get_display_text_position(
         self,
@@ -378,6 +439,21 @@ class Painter:
     def draw_logo(self, image: str, x: int, y: int, width: int, height: int) -> None:
         raise NotImplementedError
 
+    def draw_batch(self, ops: list) -> None:
+        """Draw a list of pre-built drawing operations
+
+        Operations are drawn in list order so that overlapping shapes keep their z-order.
+        This only lets callers collect their drawing into one list. Each operation is still
+        drawn by its own draw_* call, so it does not reduce drawing state changes.
+
+        Args:
+            ops (list): Drawing operations. Each operation is a tuple of the operation
+                        type ("box_with_text", "diamond" or "text") followed by the
+                        arguments of the matching draw_* method
+        """
+        for op in ops:
+            getattr(self, self.batch_draw_methods[op[0]])(*op[1:])
+
     def set_background_colour(self) -> None:
         raise NotImplementedError
 
@@ -397,6 +473,9 @@ class Painter:
     def save_surface(self, filename: str) -> None:
         raise NotImplementedError
 
+    def get_surface_buffer(self) -> memoryview:
+        raise NotImplementedError
+
 
 class PNGPainter(Painter):
     """A wrapper class for Pillow library"""
@@ -411,9 +490,19 @@ class PNGPainter(Painter):
         """
         super().__init__(width, height)
 
-        self.__surface = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        ### The surface is allocated on first use. Only the title, subtitle and timeline
+        ### are laid out before draw(), and draw() allocates the surface, so this only
+        ### saves the buffer for roadmaps that are never drawn
+        self.__surface = None
+        self.__cr = None
 
-        self.__cr = ImageDraw.Draw(self.__surface)
+    def __ensure_surface(self) -> None:
+        """Allocate the surface if it has not been allocated yet"""
+        if self.__surface is None:
+            self.__surface = Image.new(
+                "RGBA", (self.width, self.height), (0, 0, 0, 0)
+            )
+            self.__cr = ImageDraw.Draw(self.__surface)
 
     def draw_box(
         self, x: int, y: int, width: int, height: int, box_fill_colour: str
@@ -428,6 +517,7 @@ class PNGPainter(Painter):
             box_fill_colour (str: HTML colour name or hex code. Eg. #FFFFFF or LightGreen)
         """
 
+        self.__ensure_surface()
         shape = super().draw_box(x, y, width, height, box_fill_colour)
         self.__cr.rectangle(shape, fill=box_fill_colour)
 
@@ -443,6 +533,7 @@ class PNGPainter(Painter):
             height (int): Rectangle height
             box_fill_colour (str: HTML colour name or hex code. Eg. #FFFFFF or LightGreen)
         """
+        self.__ensure_surface()
         shape = super().draw_rounded_box(x, y, width, height, box_fill_colour)
         radius = 20
         self.__cr.rounded_rectangle(shape, radius, fill=box_fill_colour)
@@ -459,6 +550,7 @@ class PNGPainter(Painter):
             height (int): Rectangle height
             box_fill_colour (str: HTML colour name or hex code. Eg. #FFFFFF or LightGreen)
         """
+        self.__ensure_surface()
         box_shape, arrowhead_shape = super().draw_arrowhead_box(
             x, y, width, height, box_fill_colour
         )
@@ -516,7 +608,7 @@ class PNGPainter(Painter):
             case _:
                 raise ValueError("Invalid style")
 
-        font = ImageFont.truetype(self.get_font_path(text_font), size=text_font_size)
+        font = _resolve_font(text_font, text_font_size)
 
         multi_lines = []
         wrap_lines = []
@@ -574,6 +666,8 @@ class PNGPainter(Painter):
             fill_colour (str): Diamond fill colour in HTML colour name or hex code. Eg. #FFFFFF or LightGreen
         """
 
+        self.__ensure_surface()
+
         # Calculate the coordinates of the four points of the diamond.
         points = super().draw_diamond(x, y, width, height, fill_colour)
 
@@ -590,10 +684,11 @@ class PNGPainter(Painter):
             y (int): Y coordinate
             text (str): Text to draw/display
         """
+        self.__ensure_surface()
         self.__cr.text(
             (x, y),
             text,
-            font=ImageFont.truetype(self.get_font_path(font), font_size),
+            font=_resolve_font(font, font_size),
             anchor="la",
             fill=(font_colour),
         )
@@ -621,7 +716,8 @@ class PNGPainter(Painter):
             line_width (int): Line width
             line_style (str, optional): Line style. Defaults to "solid". Options: "solid", "dashed"
         """
-        r, g, b = ImageColor.getrgb(line_colour)
+        self.__ensure_surface()
+        r, g, b = _resolve_colour(line_colour)
 
         def linspace(start, stop, n):
             if n == 1:
@@ -669,6 +765,7 @@ class PNGPainter(Painter):
             y2 (int): y coordinate of bottom right corner of box
             colour (str): Colour of cross in HTML colour name or hex code. Eg. #FFFFFF or LightGreen
         """
+        self.__ensure_surface()
         self.__cr.line(
             (
                 x1,
@@ -695,6 +792,7 @@ class PNGPainter(Painter):
         mask.paste(255, (0, 0, logo.size[0], logo.size[1]), logo)
         logo.putalpha(mask)
 
+        self.__ensure_surface()
         self.__surface.paste(logo, (x, y))
 
     def get_text_dimension(self, text: str, font: str, font_size: int) -> tuple:
@@ -708,17 +806,11 @@ class PNGPainter(Painter):
         Returns:
             (text_width (int), text_height (int)): Text dimension (width, height)
         """
-        # Use Pillow's ImageFont module to get the dimensions of the text.
-        image_font = ImageFont.truetype(self.get_font_path(font), font_size)
-
-        left, _, right, bottom = image_font.getbbox(text)
-        font_width = right
-        font_height = bottom
-
-        return font_width, font_height
+        return _get_text_dimension(text, font, font_size)
 
     def set_background_colour(self) -> None:
         """Set surface background colour"""
+        self.__ensure_surface()
         if self.background_colour == "transparent":
             # Set transparent background
             self.__cr.rectangle((0, 0, self.width, self.height), fill=(0, 0, 0, 0))
@@ -735,7 +827,9 @@ class PNGPainter(Painter):
             height (int): Surface height
         """
         left, top, right, bottom = super().set_surface_size(width, height)
+        self.__ensure_surface()
         self.__surface = self.__surface.crop((left, top, right, bottom))
+        self.__cr = ImageDraw.Draw(self.__surface)
 
     def get_image_size(self, image: str) -> tuple:
         """Get image size
@@ -756,8 +850,17 @@ class PNGPainter(Painter):
             filename (str): PNG file name
         """
 
-        if self.__surface is not None:
-            self.__surface.save(filename)
+        self.__ensure_surface()
+        self.__surface.save(filename)
+
+    def get_surface_buffer(self) -> memoryview:
+        """Get the raw RGBA pixels of the surface, without encoding them
+
+        Returns:
+            memoryview: Surface pixels, 4 bytes per pixel, row by row
+        """
+        self.__ensure_surface()
+        return memoryview(self.__surface.tobytes())
 
 
 class SVGPainter(Painter):
@@ -862,7 +965,7 @@ class SVGPainter(Painter):
             case _:
                 raise ValueError("Invalid style")
 
-        font = ImageFont.truetype(self.get_font_path(text_font), size=text_font_size)
+        font = _resolve_font(text_font, text_font_size)
 
         multi_lines = []
         wrap_lines = []
@@ -967,7 +1070,7 @@ class SVGPainter(Painter):
         line_style: str = "dashed",
     ) -> None:
         """Draw a line"""
-        r, g, b = ImageColor.getrgb(line_colour)
+        r, g, b = _resolve_colour(line_colour)
 
         def linspace(start, stop, n):
             if n == 1:
@@ -1037,14 +1140,7 @@ class SVGPainter(Painter):
 
     def get_text_dimension(self, text: str, font: str, font_size: int) -> tuple:
         """Get text dimension"""
-        # Use Pillow's ImageFont module to get the dimensions of the text.
-        image_font = ImageFont.truetype(self.get_font_path(font), font_size)
-
-        left, _, right, bottom = image_font.getbbox(text)
-        font_width = right
-        font_height = bottom
-
-        return font_width, font_height
+        return _get_text_dimension(text, font, font_size)
 
     def set_background_colour(self) -> None:
         """Set surface background colour"""
@@ -0,0 +1,50 @@
+# MIT License
+
+# Copyright (c) 2022 CS Goh
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from enum import IntFlag
+
+
+class PrintArea(IntFlag):
+    """Roadmap areas printed by Roadmap.print_roadmap()"""
+
+    TITLE = 1
+    TIMELINE = 2
+    GROUPS = 4
+    FOOTER = 8
+    ALL = TITLE | TIMELINE | GROUPS | FOOTER
+
+    @classmethod
+    def from_str(cls, print_area: str) -> "PrintArea":
+        """Convert a print area name to a PrintArea
+
+        Args:
+            print_area (str): Area name. Options are "all", "title", "timeline", "groups", "footer".
+                              Names can be combined with "|", eg. "title|footer"
+
+        Returns:
+            PrintArea: Matching print area. Unknown names map to PrintArea.ALL
+        """
+        area = cls(0)
+        for name in print_area.split("|"):
+            area |= cls.__members__.get(name.strip().upper(), cls.ALL)
+        return area
@@ -20,8 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from datetime import datetime
+from datetime import datetime, date
 from dataclasses import dataclass, field
+from pathlib import Path
+import sys
 import time
 
 from .painter import PainterFactory
@@ -31,8 +33,10 @@ from .footer import Footer
 from .timelinemode import TimelineMode
 from .timeline import Timeline
 from .group import Group
+from .task import Task
 from .marker import Marker
 from .logo import Logo
+from .printarea import PrintArea
 
 
 @dataclass()
@@ -54,6 +58,7 @@ class Roadmap:
     _marker: Marker = field(default=None, init=False)
     _show_generic_dates: bool = field(default=False, init=False)
     _logo: Logo = field(default=None, init=False)
+    _groups_y_pos: int = field(default=None, init=False)
 
     def __post_init__(self):
         """This method is called after __init__() is called"""
@@ -162,7 +167,6 @@ class Roadmap:
         self._title = Title(
             text=text, font=font, font_size=font_size, font_colour=font_colour
         )
-        self._title.text = text
 
         self._title.set_draw_position(self._painter)
 
@@ -189,7 +193,6 @@ class Roadmap:
         self._subtitle = SubTitle(
             text=text, font=font, font_size=font_size, font_colour=font_colour
         )
-        self._subtitle.text = text
 
         self._subtitle.set_draw_position(self._painter)
 
@@ -216,16 +219,12 @@ class Roadmap:
         self._footer = Footer(
             text=text, font=font, font_size=font_size, font_colour=font_colour
         )
-        self._footer.text = text
 
     def set_timeline(
         self,
         mode: TimelineMode = TimelineMode.MONTHLY,
         *,
-        start: datetime = datetime.strptime(
-            datetime.strftime(datetime.today(), "%Y-%m-%d"),
-            "%Y-%m-%d",
-        ),
+        start: datetime | str | None = None,
         number_of_items: int = 12,
         show_generic_dates: bool = False,
         show_first_day_of_week: bool = False,
@@ -245,7 +244,7 @@ class Roadmap:
         Args:
             mode (TimelineMode, optional): Timeline mode. Defaults to TimelineMode.MONTHLY.
                                             Options are WEEKLY, MONTHLY, QUARTERLY, HALF_YEARLY, YEARLY
-            start (datetime, optional): Timeline start date. Defaults to current date
+            start (datetime | str, optional): Timeline start date as a datetime or a "YYYY-MM-DD" string. Defaults to current date
             number_of_items (int, optional): Number of time periods to display on the timeline. Defaults to 12.
             show_generic_dates (bool, optional): Show generic dates. Defaults to False.
             show_first_day_of_week (bool, optional): Show first day of week. Defaults to False. For this to work, show_generic_dates must set to False.
@@ -271,7 +270,21 @@ class Roadmap:
         item_fill_colour = item_fill_colour or self._painter.timeline_item_fill_colour
 
         self._show_generic_dates = show_generic_dates
-        start_date = datetime.strptime(start, "%Y-%m-%d")
+        if start is None:
+            start_date = datetime.combine(date.today(), datetime.min.time())
+        elif isinstance(start, str):
+            ### fromisoformat() is only used for "YYYY-MM-DD" strings, as from Python 3.11 it
+            ### also accepts times, time zones and week dates that strptime() rejects
+            start_date = None
+            if len(start) == 10 and start[4] == "-" and start[7] == "-":
+                try:
+                    start_date = datetime.fromisoformat(start)
+                except ValueError:
+                    pass
+            if start_date is None:
+                start_date = datetime.strptime(start, "%Y-%m-%d")
+        else:
+            start_date = start
         self._timeline = Timeline(
             mode=mode,
             start=start_date,
@@ -373,32 +386,36 @@ class Roadmap:
             )
         self._timeline.draw(self._painter)
 
-        ### Set the roadmap groups draw position
+        ### Set the roadmap groups draw position. Groups that have not changed
+        ### since the previous draw() keep their layout.
+        if self._groups_y_pos is None:
+            self._groups_y_pos = self._painter.next_y_pos
+        self._painter.next_y_pos = self._groups_y_pos
         for group in self._groups:
-            group.set_draw_position(self._painter, self._timeline)
+            group.ensure_layout(self._painter, self._timeline)
 
         ### Draw timeline vertical lines on the roadmap
         self._timeline.draw_vertical_lines(self._painter)
 
-        ### Draw the roadmap groups
+        ### Draw the roadmap groups in a single batch
+        ops = []
         for group in self._groups:
-            group.draw(self._painter)
+            group.emit_ops(ops)
+        self._painter.draw_batch(ops)
+
+        ### Set the marker line, footer and logo draw positions in one pass
+        self._set_chrome_draw_position()
 
         ### Draw the roadmap marker
         if self._marker is not None and self._show_generic_dates is False:
-            self._marker.set_line_draw_position(self._painter)
             self._marker.draw(self._painter)
 
         ### Draw the roadmap footer
         if self._footer is not None:
-            self._footer.set_draw_position(self._painter)
             self._footer.draw(self._painter)
 
         ### Draw logo
-
         if self._logo is not None:
-            if self._logo.position[:10] != "top-centre":
-                self._logo.set_draw_position(self._painter, self.auto_height)
             self._logo.draw(self._painter)
 
         ### Auto adjust the surface height
@@ -407,17 +424,122 @@ class Roadmap:
                 self._painter.width, int(self._painter.next_y_pos)
             )
 
-    def save(self, filename: str) -> None:
+    def _set_chrome_draw_position(self) -> None:
+        """Set the draw position of the items placed below the groups
+
+        The marker line, footer and logo positions only depend on where the last group ends,
+        so they are all set together once the groups have been laid out.
+        """
+        if self._marker is not None and self._show_generic_dates is False:
+            self._marker.set_line_draw_position(self._painter)
+
+        if self._footer is not None:
+            self._footer.set_draw_position(self._painter)
+
+        if self._logo is not None and self._logo.position[:10] != "top-centre":
+            self._logo.set_draw_position(self._painter, self.auto_height)
+
+    def save(self, filename: str, raw: bool = False) -> None:
         """Save surface to file. The file type is determined by the Painter being used.
 
         Args:
             filename (str): result file name
+            raw (bool, optional): Write the unencoded RGBA pixels instead of an image file.
+                                  Faster for intermediate saves. Defaults to False. Only supported by the PNG painter.
         """
-        self._painter.save_surface(filename)
+        if raw is True:
+            Path(filename).write_bytes(self._painter.get_surface_buffer())
+        else:
+            self._painter.save_surface(filename)
 
         elapsed_time = (time.time() - self.start_time) * 1000
         print(f"Took [{elapsed_time:.2f}ms] to generate '{filename}' roadmap")
 
+    def print_roadmap(self, print_area: str | PrintArea = "all") -> None:
+        """Print the calculated draw positions of the roadmap. Useful for debugging.
+
+        The positions are the ones calculated by the last draw() call. The title, subtitle and
+        timeline are positioned when they are set, but groups, tasks, milestones and the footer
+        are only positioned by draw(), so they are printed with zero positions before it.
+
+        Args:
+            print_area (str | PrintArea, optional): Area to print. Defaults to "all".
+                                                    Options are "all", "title", "timeline", "groups", "footer".
+                                                    Areas can be combined, eg. "title|footer"
+        """
+        if isinstance(print_area, str):
+            print_area = PrintArea.from_str(print_area)
+        lines = []
+
+        if print_area & PrintArea.TITLE:
+            if self._title is not None:
+                lines.append(
+                    f"Title: '{self._title.text}' x={self._title.x:.2f}, y={self._title.y:.2f}, "
+                    f"w={self._title.width:.2f}, h={self._title.height:.2f}"
+                )
+            if self._subtitle is not None:
+                lines.append(
+                    f"Subtitle: '{self._subtitle.text}' x={self._subtitle.x:.2f}, y={self._subtitle.y:.2f}, "
+                    f"w={self._subtitle.width:.2f}, h={self._subtitle.height:.2f}"
+                )
+
+        if print_area & PrintArea.TIMELINE:
+            if self._timeline is not None:
+                lines.append(
+                    f"Timeline: x={self._timeline.x:.2f}, y={self._timeline.y:.2f}, "
+                    f"w={self._timeline.width:.2f}"
+                )
+                lines.extend(
+                    f"  Year: '{year.text}' x={year.box_x:.2f}, y={year.box_y:.2f}, "
+                    f"w={year.box_width:.2f}, h={year.box_height:.2f}"
+                    for year in self._timeline.timeline_years
+                )
+                lines.extend(
+                    f"  Item: '{item.text}' {item.start:%Y-%m-%d} - {item.end:%Y-%m-%d} "
+                    f"x={item.box_x:.2f}, y={item.box_y:.2f}, "
+                    f"w={item.box_width:.2f}, h={item.box_height:.2f}"
+                    for item in self._timeline.timeline_items
+                )
+
+        if print_area & PrintArea.GROUPS:
+            for group in self._groups:
+                lines.append(
+                    f"Group: '{group.text}' x={group.box_x:.2f}, y={group.box_y:.2f}, "
+                    f"w={group.box_width:.2f}, h={group.box_height:.2f}"
+                )
+                for task in group.tasks:
+                    self._append_task_print_lines(lines, task, "  ")
+
+        if print_area & PrintArea.FOOTER:
+            if self._footer is not None:
+                lines.append(
+                    f"Footer: '{self._footer.text}' x={self._footer.x:.2f}, y={self._footer.y:.2f}"
+                )
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def _append_task_print_lines(self, lines: list, task: Task, indent: str) -> None:
+        """Append the print lines of a task, its milestones and its parallel tasks
+
+        Args:
+            lines (list): Lines to append to
+            task (Task): Task instance
+            indent (str): Line indentation
+        """
+        lines.append(
+            f"{indent}Task: '{task.text}' {task.start} - {task.end} "
+            f"x={task.box_x:.2f}, y={task.box_y:.2f}, "
+            f"w={task.box_width:.2f}, h={task.box_height:.2f}"
+        )
+        lines.extend(
+            f"{indent}  Milestone: '{milestone.text}' {milestone.date} "
+            f"x={milestone.diamond_x:.2f}, y={milestone.diamond_y:.2f}, "
+            f"text_x={milestone.text_x:.2f}, text_y={milestone.text_y:.2f}"
+            for milestone in task.milestones
+        )
+        for parallel_task in task.tasks:
+            self._append_task_print_lines(lines, parallel_task, indent + "  ")
+
     def __enter__(self):
         """This method is called when the 'with' statement is used"""
         return self
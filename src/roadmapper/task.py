@@ -23,15 +23,30 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from .layouttracker import LayoutTracker
 from .milestone import Milestone
 from .painter import Painter
 from .timeline import Timeline
 
 
-@dataclass(kw_only=True)
-class Task:
+@dataclass(kw_only=True, slots=True)
+class Task(LayoutTracker):
     """Roadmap Task class"""
 
+    _layout_fields = frozenset(
+        {
+            "text",
+            "start",
+            "end",
+            "font",
+            "font_size",
+            "font_colour",
+            "fill_colour",
+            "text_alignment",
+            "style",
+        }
+    )
+
     text: str = field(init=True, default=None)
     start: datetime = field(init=True, default=None)
     end: datetime = field(init=True, default=None)
@@ -54,6 +69,11 @@ class Task:
     box_height: int = field(init=False, default=0)
     text_x: int = field(init=False, default=0)
     text_y: int = field(init=False, default=0)
+    _layout_dirty: bool = field(init=False, default=True, repr=False, compare=False)
+    _layout_tasks: tuple = field(init=False, default=(), repr=False, compare=False)
+    _layout_milestones: tuple = field(
+        init=False, default=(), repr=False, compare=False
+    )
 
     def add_parallel_task(
         self,
@@ -145,6 +165,20 @@ class Task:
             )
         )
 
+    def is_layout_dirty(self) -> bool:
+        """Check whether this task, its parallel tasks or its milestones changed since the last layout
+
+        Returns:
+            bool: True if the task needs to be laid out again
+        """
+        return (
+            self._layout_dirty
+            or self._children_changed(self._layout_tasks, self.tasks)
+            or self._children_changed(self._layout_milestones, self.milestones)
+            or any(task.is_layout_dirty() for task in self.tasks)
+            or any(milestone.is_layout_dirty() for milestone in self.milestones)
+        )
+
     def set_draw_position(
         self,
         painter: Painter,
@@ -198,6 +232,9 @@ class Task:
 
         ### Set milestones position
         self.set_milestones_position(painter, timeline)
+        self._layout_dirty = False
+        self._layout_tasks = tuple(self.tasks)
+        self._layout_milestones = tuple(self.milestones)
 
     def set_milestones_position(
         self,
@@ -212,23 +249,34 @@ class Task:
             task_start_period (datetime): Task start date
             task_end_period (datetime): Task end date
         """
+        ### Milestones moved out of the timeline range must not keep a previous position
+        for milestone in self.milestones:
+            milestone.diamond_x = 0
+            milestone.diamond_y = 0
+            milestone.text_x = 0
+            milestone.text_y = 0
+            milestone._layout_dirty = False
+
+        ### Parse the milestone dates once rather than once per timeline item
+        milestone_dates = [
+            datetime.strptime(milestone.date, "%Y-%m-%d")
+            for milestone in self.milestones
+        ]
+
         for timeline_item in timeline.timeline_items:
-            (
-                timeline_start_period,
-                timeline_end_period,
-            ) = timeline_item.get_timeline_period(timeline.mode)
+            ### The timeline item period is worked out when the timeline is built
+            timeline_start_period = timeline_item.start
+            timeline_end_period = timeline_item.end
 
             bar_x_pos = timeline_item.box_x
-            for milestone in self.milestones:
-                milestone_date = datetime.strptime(milestone.date, "%Y-%m-%d")
-                (
-                    _,
-                    milestone_pos_percentage,
-                ) = timeline_item.get_timeline_pos_percentage(
-                    timeline.mode, milestone_date
-                )
-
+            for milestone, milestone_date in zip(self.milestones, milestone_dates):
                 if timeline_start_period <= milestone_date <= timeline_end_period:
+                    (
+                        _,
+                        milestone_pos_percentage,
+                    ) = timeline_item.get_timeline_pos_percentage(
+                        timeline.mode, milestone_date
+                    )
                     milestone.diamond_x = (
                         bar_x_pos
                         + (timeline_item.box_width * milestone_pos_percentage)
@@ -402,15 +450,14 @@ class Task:
             task_end_period (datetime): Task end date
         """
         self.box_x = 0
+        self.boxes = []
         row_match = 0
         bar_start_x_pos = 0
 
         for timeline_item in timeline.timeline_items:
             ### Get the start and end period of the timeline item
-            (
-                timeline_start_period,
-                timeline_end_period,
-            ) = timeline_item.get_timeline_period(timeline.mode)
+            timeline_start_period = timeline_item.start
+            timeline_end_period = timeline_item.end
 
             ### Check if the task is within the timeline period
             if (
@@ -531,11 +578,11 @@ class Task:
             self.text_x = text_x_pos
             self.text_y = text_y_pos
 
-    def draw(self, painter: Painter) -> None:
-        """Draw the task
+    def emit_ops(self, ops: list) -> None:
+        """Append the drawing operations of this task, its parallel tasks and milestones
 
         Args:
-            painter (Painter): Pillow wrapper class instance
+            ops (list): Drawing operations to be drawn by Painter.draw_batch()
         """
         box_x = 0
         box_y = 0
@@ -562,25 +609,38 @@ class Task:
         )
 
         if box_x != 0 or box_y != 0 or box_width != 0 or box_height != 0:
-            painter.draw_box_with_text(
-                box_x,
-                box_y,
-                box_width,
-                box_height,
-                self.fill_colour,
-                self.text,
-                self.text_alignment,
-                self.font,
-                self.font_size,
-                self.font_colour,
-                style=self.style,
+            ops.append(
+                (
+                    "box_with_text",
+                    box_x,
+                    box_y,
+                    box_width,
+                    box_height,
+                    self.fill_colour,
+                    self.text,
+                    self.text_alignment,
+                    self.font,
+                    self.font_size,
+                    self.font_colour,
+                    self.style,
+                )
             )
 
             for task in self.tasks:
-                task.draw(painter)
+                task.emit_ops(ops)
 
             for milestone in self.milestones:
-                milestone.draw(painter)
+                milestone.emit_ops(ops)
+
+    def draw(self, painter: Painter) -> None:
+        """Draw the task
+
+        Args:
+            painter (Painter): Pillow wrapper class instance
+        """
+        ops = []
+        self.emit_ops(ops)
+        painter.draw_batch(ops)
 
     def __enter__(self):
         """This method is called when the 'with' statement is used"""
@@ -21,7 +21,6 @@
 # SOFTWARE.
 
 from datetime import datetime, date, timedelta
-from dateutil.relativedelta import relativedelta
 from dataclasses import dataclass, field
 import calendar
 
@@ -144,15 +143,22 @@ class Timeline:
         self.set_locale(self.locale_name)
         self.x, self.y, self.width = self.__calculate_draw_position(painter)
 
+        ### Calculate the value and period of every timeline item in a single pass
+        timelineitem_values = [
+            self.__get_timeline_item_value(index)
+            for index in range(self.number_of_items)
+        ]
+        timelineitem_dates = [
+            self.__get_timeline_item_dates(timelineitem_value)
+            for timelineitem_value in timelineitem_values
+        ]
+        timelineitemgroup_start, timelineitemgroup_end = timelineitem_dates[-1]
+
         ### Calculate timelineitemgroup positions
         year_groups = {}
 
         for index in range(self.number_of_items):
-            index_year = self.__get_timeline_item_value(index)[0:4]
-            (
-                timelineitemgroup_start,
-                timelineitemgroup_end,
-            ) = self.__get_timeline_item_dates(index)
+            index_year = timelineitem_values[index][0:4]
 
             if self.show_generic_dates is False:
                 if index_year in year_groups:
@@ -185,20 +191,19 @@ class Timeline:
         timelineitem_width = int(self.width / self.number_of_items) - (
             painter.gap_between_timeline_item / 2
         )
+        timelineitem_xs = [
+            self.x
+            + (index * timelineitem_width)
+            + (index * (painter.gap_between_timeline_item / 2))
+            for index in range(self.number_of_items)
+        ]
 
         if self.mode != TimelineMode.YEARLY:
             timelineitemgroup_y = self.y + painter.timeline_height
             timelineitemgroup_height = painter.timeline_height
             index = 0
             for year in year_groups:
-
-                ##------------
-                timelineitemgroup_x = (
-                    self.x
-                    + (index * timelineitem_width)
-                    + (index * (painter.gap_between_timeline_item / 2))
-                )
-                ##------------
+                timelineitemgroup_x = timelineitem_xs[index]
 
                 timelineitemgroup_width = timelineitem_width * year_groups[year] + (
                     (painter.gap_between_timeline_item / 2) * (year_groups[year] - 1)
@@ -238,14 +243,10 @@ class Timeline:
         timelineitem_height = painter.timeline_height
 
         for index in range(self.number_of_items):
-            timelineitem_x = (
-                self.x
-                + (index * timelineitem_width)
-                + (index * (painter.gap_between_timeline_item / 2))
-            )
+            timelineitem_x = timelineitem_xs[index]
             timelineitem_text = self.__get_timeline_item_text(index)
-            timelineitem_value = self.__get_timeline_item_value(index)
-            timelineitem_start, timelineitem_end = self.__get_timeline_item_dates(index)
+            timelineitem_value = timelineitem_values[index]
+            timelineitem_start, timelineitem_end = timelineitem_dates[index]
 
             timelineitem = TimelineItem(
                 text=timelineitem_text,
@@ -286,7 +287,7 @@ class Timeline:
                 if self.show_first_day_of_week is False:
                     this_week = self.__find_first_day_of_week(
                         self.start
-                    ) + relativedelta(weeks=+index)
+                    ) + timedelta(weeks=index)
                     this_week_number = int(this_week.strftime("%W"))
                     # timeline_text = f"W{this_week_number}"
                     timeline_text = self.week_generic_text_format.format(
@@ -295,7 +296,7 @@ class Timeline:
                 else:
                     this_week = self.__find_first_day_of_week(
                         self.start
-                    ) + relativedelta(weeks=+index)
+                    ) + timedelta(weeks=index)
                     this_week_number = int(this_week.strftime("%W"))
                     first_day_of_week = self.__get_monday_from_calendar_week(
                         this_week.year, this_week_number
@@ -314,7 +315,7 @@ class Timeline:
 
         elif self.mode == TimelineMode.MONTHLY:
             if self.show_generic_dates is False:
-                this_month = self.start + relativedelta(months=+index)
+                this_month = self.__add_months(index)
                 # timeline_text = f"{this_month.strftime('%b')}"
                 timeline_text = self.month_text_format.format(this_month.strftime("%b"))
             else:
@@ -323,7 +324,7 @@ class Timeline:
                 timeline_text = self.month_generic_text_format.format(this_month)
         elif self.mode == TimelineMode.QUARTERLY:
             if self.show_generic_dates is False:
-                this_month = self.start + relativedelta(months=+(index * 3))
+                this_month = self.__add_months(index * 3)
                 this_quarter = (this_month.month - 1) // 3 + 1
                 # timeline_text = f"Q{this_quarter}"
             else:
@@ -333,7 +334,7 @@ class Timeline:
             timeline_text = self.quarter_text_format.format(this_quarter)
         elif self.mode == TimelineMode.HALF_YEARLY:
             if self.show_generic_dates is False:
-                this_month = self.start + relativedelta(months=+(index * 6))
+                this_month = self.__add_months(index * 6)
                 this_halfyear = (this_month.month - 1) // 6 + 1
                 # timeline_text = f"H{this_halfyear}"
             else:
@@ -343,7 +344,7 @@ class Timeline:
             timeline_text = self.half_year_text_format.format(this_halfyear)
         elif self.mode == TimelineMode.YEARLY:
             if self.show_generic_dates is False:
-                this_month = self.start + relativedelta(months=+(index * 12))
+                this_month = self.__add_months(index * 12)
                 # timeline_text = f"{this_month.year}"
                 timeline_text = self.year_text_format.format(this_month.year)
             else:
@@ -354,6 +355,22 @@ class Timeline:
 
         return timeline_text
 
+    def __add_months(self, months: int) -> datetime:
+        """Add months to the timeline start date using integer year/month arithmetic
+
+        Args:
+            months (int): Number of months to add
+
+        Returns:
+            datetime: Start date moved by the given months. The day is clamped to the
+                      last day of the resulting month.
+        """
+        year, month = divmod(self.start.month - 1 + months, 12)
+        year += self.start.year
+        month += 1
+        day = min(self.start.day, calendar.monthrange(year, month)[1])
+        return self.start.replace(year=year, month=month, day=day)
+
     def __find_first_day_of_week(self, this_date: datetime) -> datetime:
         _, _, day_of_week = this_date.isocalendar()
         return this_date - timedelta(days=day_of_week - 1)
@@ -375,8 +392,8 @@ class Timeline:
             ### if index > 52, then reset the index number to 1
             # index = index % 52
 
-            this_week = self.__find_first_day_of_week(self.start) + relativedelta(
-                weeks=+index
+            this_week = self.__find_first_day_of_week(self.start) + timedelta(
+                weeks=index
             )
 
             week_value = int(this_week.strftime("%W"))  # + 1
@@ -388,27 +405,29 @@ class Timeline:
             timeline_value = f"{this_week.year}{week_value}"
                 # print(f"V:{index} = {this_week}, {week_value}")
         elif self.mode == TimelineMode.MONTHLY:
-            this_month = self.start + relativedelta(months=+index)
+            this_month = self.__add_months(index)
             timeline_value = f"{this_month.year}{this_month.strftime('%m')}"
         elif self.mode == TimelineMode.QUARTERLY:
-            this_month = self.start + relativedelta(months=+(index * 3))
+            this_month = self.__add_months(index * 3)
             this_quarter = (this_month.month - 1) // 3 + 1
             timeline_value = f"{this_month.year}{this_quarter}"
         elif self.mode == TimelineMode.HALF_YEARLY:
-            this_month = self.start + relativedelta(months=+(index * 6))
+            this_month = self.__add_months(index * 6)
             this_halfyear = (this_month.month - 1) // 6 + 1
             timeline_value = f"{this_month.year}{this_halfyear}"
         elif self.mode == TimelineMode.YEARLY:
-            this_month = self.start + relativedelta(months=+(index * 12))
+            this_month = self.__add_months(index * 12)
             timeline_value = f"{this_month.year}"
 
         return timeline_value
 
-    def __get_timeline_item_dates(self, index: int) -> tuple[datetime, datetime]:
+    def __get_timeline_item_dates(
+        self, timeline_period: str
+    ) -> tuple[datetime, datetime]:
         """Get the start and end dates of the timeline item
 
         Args:
-            index (int): Index of the timeline item
+            timeline_period (str): Value of the timeline item
 
         Returns:
             tuple[datetime, datetime]: Start and end dates of the timeline item
@@ -416,7 +435,6 @@ class Timeline:
         timeline_start_period = ""
         timeline_end_period = ""
         if self.mode == TimelineMode.WEEKLY:
-            timeline_period = self.__get_timeline_item_value(index)
             ### timeline_period is in the format YYYYWW
             this_year = timeline_period[0:4]  ### First 4 characters
             this_week = timeline_period[4:]  ### Last 2 characters
@@ -436,13 +454,12 @@ class Timeline:
                 hour=0, minute=0, second=0, microsecond=0
             )
         elif self.mode == TimelineMode.MONTHLY:
-            this_month = (self.start + relativedelta(months=+index)).month
-            this_year = (self.start + relativedelta(months=+index)).year
+            this_year = int(timeline_period[0:4])
+            this_month = int(timeline_period[4:])
             _, month_end_day = calendar.monthrange(this_year, this_month)
             timeline_start_period = datetime(this_year, this_month, 1)
             timeline_end_period = datetime(this_year, this_month, month_end_day)
         elif self.mode == TimelineMode.QUARTERLY:
-            timeline_period = self.__get_timeline_item_value(index)
             this_year = int(timeline_period[0:4])
             this_quarter = int(timeline_period[4:])
             if this_quarter == 1:
@@ -461,7 +478,6 @@ class Timeline:
                 this_year + 3 * this_quarter // 12, 3 * this_quarter % 12 + 1, 1
             ) + timedelta(days=-1)
         elif self.mode == TimelineMode.HALF_YEARLY:
-            timeline_period = self.__get_timeline_item_value(index)
             this_year = int(timeline_period[0:4])
             this_half = int(timeline_period[4:])
             if this_half == 1:  # First Half
@@ -471,7 +487,6 @@ class Timeline:
                 timeline_start_period = datetime(this_year, 7, 1)
                 timeline_end_period = datetime(this_year, 12, 31)
         elif self.mode == TimelineMode.YEARLY:
-            timeline_period = self.__get_timeline_item_value(index)
             timeline_start_period = datetime(int(timeline_period), 1, 1)
             timeline_end_period = datetime(int(timeline_period), 12, 31)
         return timeline_start_period, timeline_end_period
@@ -1,10 +1,13 @@
 import os.path
 import time
 import calendar
+from datetime import datetime, date
 
 import pytest
 
+from src.roadmapper.milestone import Milestone
 from src.roadmapper.roadmap import Roadmap
+from src.roadmapper.timelinemode import TimelineMode
 
 
 @pytest.mark.unit
@@ -22,6 +25,21 @@ class TestRoadmapDraw:
         assert os.path.exists(filename_with_ts)
         os.remove(filename_with_ts)
 
+    def test_save_roadmap_raw(self):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_timeline(start="2023-01-01")
+        roadmap.set_title("Test Title")
+
+        roadmap.draw()
+
+        filename_with_ts = str(calendar.timegm(time.gmtime())) + ".raw"
+        roadmap.save(filename_with_ts, raw=True)
+
+        file_size = os.path.getsize(filename_with_ts)
+        os.remove(filename_with_ts)
+        assert file_size > 0
+        assert file_size % (roadmap.width * 4) == 0
+
     def test_draw_roadmap_requires_timeline(self):
         roadmap: Roadmap = Roadmap()
         roadmap.set_title("Test Title")
@@ -38,3 +56,269 @@ class TestRoadmapDraw:
             roadmap.draw()
 
         assert "title" in str(e.value).lower()
+
+    def test_draw_roadmap_twice_keeps_layout(self):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline(start="2023-01-01")
+        group = roadmap.add_group("Group")
+        task = group.add_task("Task", "2023-02-01", "2023-05-15")
+        task.add_milestone("Milestone", "2023-04-01")
+
+        roadmap.draw()
+        group_position = (group.box_x, group.box_y, group.box_height)
+        task_boxes = list(task.boxes)
+
+        roadmap.draw()
+
+        assert (group.box_x, group.box_y, group.box_height) == group_position
+        assert task.boxes == task_boxes
+
+        task.add_parallel_task("Parallel Task", "2023-06-01", "2023-07-15")
+        assert group.is_layout_dirty() is True
+
+        roadmap.draw()
+
+        assert group.is_layout_dirty() is False
+        assert group.box_y == group_position[1]
+
+        group.text = "Renamed Group"
+        assert group.is_layout_dirty() is True
+        roadmap.draw()
+        assert group.is_layout_dirty() is False
+
+        task.text = "Renamed Task"
+        task.fill_colour = "Red"
+        task.milestones[0].date = "2023-04-20"
+        assert group.is_layout_dirty() is True
+
+        roadmap.draw()
+
+        expected: Roadmap = Roadmap()
+        expected.set_title("Test Title")
+        expected.set_timeline(start="2023-01-01")
+        expected_group = expected.add_group("Renamed Group")
+        expected_task = expected_group.add_task(
+            "Renamed Task", "2023-02-01", "2023-05-15", fill_colour="Red"
+        )
+        expected_task.add_milestone("Milestone", "2023-04-20")
+        expected_task.add_parallel_task("Parallel Task", "2023-06-01", "2023-07-15")
+        expected.draw()
+
+        assert bytes(roadmap._painter.get_surface_buffer()) == bytes(
+            expected._painter.get_surface_buffer()
+        )
+
+    def test_print_roadmap(self, capsys):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline(start="2023-01-01")
+        group = roadmap.add_group("Group")
+        task = group.add_task("Task", "2023-02-01", "2023-05-15")
+        task.add_milestone("Milestone", "2023-04-01")
+        roadmap.set_footer("Footer")
+        roadmap.draw()
+
+        roadmap.print_roadmap()
+        output = capsys.readouterr().out
+
+        assert "Title: 'Test Title'" in output
+        assert "Item: 'Jan'" in output
+        assert "Group: 'Group'" in output
+        assert "Milestone: 'Milestone'" in output
+        assert "Footer: 'Footer'" in output
+
+        roadmap.print_roadmap("groups")
+        output = capsys.readouterr().out
+
+        assert "Group: 'Group'" in output
+        assert "Title:" not in output
+
+        roadmap.print_roadmap("title|footer")
+        output = capsys.readouterr().out
+
+        assert "Title: 'Test Title'" in output
+        assert "Footer: 'Footer'" in output
+        assert "Group:" not in output
+
+    def test_set_timeline_start_defaults_to_today(self):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline()
+
+        today = datetime.combine(date.today(), datetime.min.time())
+        first_item = roadmap._timeline.timeline_items[0]
+        assert first_item.start <= today <= first_item.end
+
+    def test_set_timeline_accepts_datetime_start(self):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline(start=datetime(2023, 1, 1))
+
+        assert roadmap._timeline.timeline_items[0].start == datetime(2023, 1, 1)
+
+    def test_marker_is_placed_in_timeline_item_enclosing_today(self):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline()
+
+        first_item = roadmap._timeline.timeline_items[0]
+        assert roadmap._marker.not_in_timeline_range is False
+        assert first_item.box_x <= roadmap._marker.line_from_x
+        assert roadmap._marker.line_from_x <= first_item.box_x + first_item.box_width
+
+    def test_marker_outside_timeline_range(self):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline(start=datetime(date.today().year + 2, 1, 1))
+
+        assert roadmap._marker.not_in_timeline_range is True
+
+    def test_set_timeline_accepts_non_padded_start(self):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline(start="2023-1-1")
+
+        assert roadmap._timeline.timeline_items[0].start == datetime(2023, 1, 1)
+
+    def test_marker_in_weekly_timeline_crossing_year_boundary(self, monkeypatch):
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(2024, 12, 25, 10, 30)
+
+        monkeypatch.setattr("src.roadmapper.marker.datetime", FrozenDatetime)
+
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline(TimelineMode.WEEKLY, start="2024-10-17")
+
+        enclosing_item = next(
+            item
+            for item in roadmap._timeline.timeline_items
+            if item.start <= datetime(2024, 12, 25) <= item.end
+        )
+        assert roadmap._marker.not_in_timeline_range is False
+        assert enclosing_item.box_x <= roadmap._marker.line_from_x
+        assert (
+            roadmap._marker.line_from_x
+            <= enclosing_item.box_x + enclosing_item.box_width
+        )
+
+    def test_group_draw_uses_current_state(self):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline(start="2023-01-01")
+        group = roadmap.add_group("Group")
+        group.add_task("Task", "2023-02-01", "2023-05-15")
+
+        ops = []
+        group.emit_ops(ops)
+        assert [op[0] for op in ops] == ["box_with_text"]
+
+        roadmap.draw()
+        group.fill_colour = "Red"
+
+        ops = []
+        group.emit_ops(ops)
+        assert [op[0] for op in ops] == ["box_with_text", "box_with_text"]
+        assert ops[0][5] == "Red"
+
+    def test_removing_task_between_draws_updates_layout(self):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline(start="2023-01-01")
+        group = roadmap.add_group("Group")
+        task = group.add_task("A", "2023-02-01", "2023-05-15")
+        task.add_milestone("Milestone", "2023-04-01")
+        group.add_task("B", "2023-03-01", "2023-06-15")
+
+        roadmap.draw()
+        two_task_height = group.box_height
+
+        group.tasks.pop()
+        assert group.is_layout_dirty() is True
+        roadmap.draw()
+
+        assert group.box_height < two_task_height
+        ops = []
+        group.emit_ops(ops)
+        assert "B" not in [op[6] for op in ops if op[0] == "box_with_text"]
+
+        task.milestones.clear()
+        assert group.is_layout_dirty() is True
+
+    def test_layout_state_is_not_in_repr_or_eq(self):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline(start="2023-01-01")
+        group = roadmap.add_group("Group")
+        group.add_task("Task", "2023-02-01", "2023-05-15")
+        roadmap.draw()
+
+        assert "_layout" not in repr(group)
+        assert not hasattr(group, "__dict__")
+
+        milestone = Milestone(text="Milestone", date="2023-04-01")
+        other_milestone = Milestone(text="Milestone", date="2023-04-01")
+        milestone._layout_dirty = False
+        assert milestone == other_milestone
+
+    def test_print_roadmap_before_draw(self, capsys):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline(start="2023-01-01")
+        roadmap.add_group("Group")
+        roadmap.set_footer("Footer")
+
+        roadmap.print_roadmap("title|groups")
+        output = capsys.readouterr().out
+
+        assert "Title: 'Test Title' x=0.00" not in output
+        assert "Group: 'Group' x=0.00, y=0.00, w=0.00, h=0.00" in output
+
+    @pytest.mark.parametrize(
+        "start",
+        ["20230101", "2023-W05-1", "2023-01-01T15:00", "2023-01-01T00:00+05:00"],
+    )
+    def test_set_timeline_rejects_non_date_iso_strings(self, start):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+
+        with pytest.raises(ValueError):
+            roadmap.set_timeline(start=start)
+
+    @pytest.mark.parametrize(
+        "mode, start, months, expected",
+        [
+            (TimelineMode.MONTHLY, "2023-01-31", 1, datetime(2023, 2, 28)),
+            (TimelineMode.MONTHLY, "2024-01-31", 1, datetime(2024, 2, 29)),
+            (TimelineMode.MONTHLY, "2023-01-31", 2, datetime(2023, 3, 31)),
+            (TimelineMode.MONTHLY, "2023-01-31", 14, datetime(2024, 3, 31)),
+            (TimelineMode.QUARTERLY, "2022-11-30", 3, datetime(2023, 2, 28)),
+            (TimelineMode.QUARTERLY, "2022-11-30", 6, datetime(2023, 5, 30)),
+        ],
+    )
+    def test_timeline_add_months_clamps_month_end(self, mode, start, months, expected):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline(mode, start=start)
+
+        assert roadmap._timeline._Timeline__add_months(months) == expected
+
+    def test_timeline_items_from_month_end_start(self):
+        roadmap: Roadmap = Roadmap()
+        roadmap.set_title("Test Title")
+        roadmap.set_timeline(TimelineMode.MONTHLY, start="2023-01-31")
+        assert [item.value for item in roadmap._timeline.timeline_items][:3] == [
+            "202301",
+            "202302",
+            "202303",
+        ]
+
+        roadmap.set_timeline(TimelineMode.QUARTERLY, start="2022-11-30")
+        assert [item.value for item in roadmap._timeline.timeline_items][:3] == [
+            "20224",
+            "20231",
+            "20232",
+        ]
@@ -1,4 +1,9 @@
-from src.roadmapper.painter import PNGPainter
+from src.roadmapper.painter import (
+    PNGPainter,
+    SVGPainter,
+    _get_text_dimension,
+    _resolve_font,
+)
 
 
 class TestPainter:
@@ -63,3 +68,44 @@ class TestPainter:
         # Linux returns different text width
         assert text_width in [62, 64]
         assert text_height == 11
+
+    def test_get_text_dimension_is_cached(self):
+        painter = PNGPainter(800, 600)
+        dimension = painter.get_text_dimension("Cached text", "Arial", 12)
+        hits = _get_text_dimension.cache_info().hits
+
+        assert painter.get_text_dimension("Cached text", "Arial", 12) == dimension
+        assert _get_text_dimension.cache_info().hits == hits + 1
+
+    def test_resolve_font_is_cached(self):
+        assert _resolve_font("Arial", 12) is _resolve_font("Arial", 12)
+
+    def test_surface_is_allocated_on_first_draw(self):
+        painter = PNGPainter(800, 600)
+        painter.set_colour_theme("DEFAULT")
+        painter.get_text_dimension("Hello World", "Arial", 12)
+        assert painter._PNGPainter__surface is None
+
+        painter.set_background_colour()
+        assert painter._PNGPainter__surface.size == (800, 600)
+
+    def test_save_surface_without_drawing(self, tmp_path):
+        painter = PNGPainter(800, 600)
+        filename = tmp_path / "blank.png"
+        painter.save_surface(str(filename))
+        assert filename.exists()
+
+    def test_draw_batch_keeps_draw_order(self):
+        painter = SVGPainter(800, 600)
+        painter.draw_batch(
+            [
+                ("diamond", 10, 10, 26, 26, "Red"),
+                ("text", 10, 40, "v1.0", "Arial", 10, "Black"),
+                ("diamond", 50, 10, 26, 26, "Blue"),
+            ]
+        )
+        assert [type(element).__name__ for element in painter.elements] == [
+            "Lines",
+            "Text",
+            "Lines",
+        ]